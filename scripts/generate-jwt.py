@@ -28,7 +28,12 @@ except ImportError as e:
 
 
 def load_private_key(key_path):
-    """Load private key from file."""
+    """
+    Load private key from file.
+
+    Returns the deserialized RSAPrivateKey rather than the PEM text, so that
+    jwt.encode() can use it directly without re-running the key check.
+    """
     try:
         with open(key_path, 'r') as key_file:
             private_key_pem = key_file.read()
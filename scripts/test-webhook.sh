@@ -161,6 +161,10 @@ echo ""
 if [ "$http_code" = "200" ]; then
     echo -e "${GREEN}✅ Success! Webhook processed successfully${NC}"
     exit 0
+elif [ "$http_code" = "202" ]; then
+    echo -e "${GREEN}✅ Success! Webhook accepted - approval is running in the background${NC}"
+    echo "Check the webhook server logs for the approval result"
+    exit 0
 elif [ "$http_code" = "401" ]; then
     echo -e "${RED}❌ Authentication failed${NC}"
     echo "The webhook signature was invalid or missing"
@@ -17,17 +17,24 @@ License: MIT
 """
 
 import os
+import base64
 import hmac
-import hashlib
-import json
 import time
 import logging
+import threading
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-import jwt
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, request, jsonify
+from jwt.algorithms import RSAAlgorithm
 from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from cryptography.hazmat.backends import default_backend
 
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
@@ -54,18 +61,132 @@ if not all([GITHUB_APP_ID, GITHUB_WEBHOOK_SECRET, GITHUB_APP_PRIVATE_KEY_PATH]):
     logger.error("Required: GITHUB_APP_ID, GITHUB_WEBHOOK_SECRET, GITHUB_APP_PRIVATE_KEY_PATH")
     exit(1)
 
-logger.info(f"LOG LEVEL IS: {LOG_LEVEL}")
+logger.info("LOG LEVEL IS: %s", LOG_LEVEL)
 
 # Load private key
 try:
     with open(GITHUB_APP_PRIVATE_KEY_PATH, 'r') as key_file:
         GITHUB_APP_PRIVATE_KEY = key_file.read()
-    logger.info(f"Private key loaded successfully from {GITHUB_APP_PRIVATE_KEY_PATH}")
+    logger.info("Private key loaded successfully from %s", GITHUB_APP_PRIVATE_KEY_PATH)
 except FileNotFoundError:
-    logger.error(f"Private key file not found: {GITHUB_APP_PRIVATE_KEY_PATH}")
+    logger.error("Private key file not found: %s", GITHUB_APP_PRIVATE_KEY_PATH)
     exit(1)
 
 
+@dataclass(frozen=True)
+class Config:
+    """Validated, preprocessed configuration used on the request path."""
+    app_id: str
+    # Webhook secret, encoded once so verification doesn't re-encode it
+    secret: bytes
+    # Deserialized once so the RSA key consistency/primality check only runs
+    # here instead of on every signature
+    private_key: RSAPrivateKey
+
+
+try:
+    _private_key = serialization.load_pem_private_key(
+        GITHUB_APP_PRIVATE_KEY.encode(),
+        password=None,
+        backend=default_backend()
+    )
+except (ValueError, TypeError) as e:
+    logger.error("Failed to parse private key from %s: %s", GITHUB_APP_PRIVATE_KEY_PATH, e)
+    exit(1)
+
+CFG = Config(
+    app_id=GITHUB_APP_ID,
+    secret=GITHUB_WEBHOOK_SECRET.encode(),
+    private_key=_private_key
+)
+
+# A GitHub App JWT is valid for 10 minutes; reuse it instead of signing a new
+# one for every webhook. Refreshed once it is within 30 seconds of expiring.
+JWT_LIFETIME_SECONDS = 10 * 60
+JWT_REFRESH_MARGIN_SECONDS = 30
+_jwt_cache = {'token': None, 'exp': 0}
+_jwt_lock = threading.Lock()
+
+# RS256 signer and JWT header are built once. Using PyJWT's algorithm object
+# directly skips jwt.encode()'s registry lookup, key preparation and claim
+# serialization on each call.
+_RS256 = RSAAlgorithm(RSAAlgorithm.SHA256)
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"RS256","typ":"JWT"}').rstrip(b'=')
+
+# Installation access tokens are valid for about an hour. Cache them per
+# installation as (token, expires_at epoch) and refresh a minute before expiry.
+INSTALLATION_TOKEN_REFRESH_MARGIN_SECONDS = 60
+_inst_token_cache: dict[int, tuple[str, float]] = {}
+# One lock per installation, so only one thread fetches a given token while
+# fetches for other installations proceed. _inst_token_locks_guard is only
+# held long enough to look up or create an installation's lock.
+_inst_token_locks: dict[int, threading.Lock] = {}
+_inst_token_locks_guard = threading.Lock()
+
+# Headers sent with every GitHub API request; only Authorization varies
+_BASE_HEADERS = {
+    'Accept': 'application/vnd.github+json',
+    'X-GitHub-Api-Version': '2022-11-28',
+    'Content-Type': 'application/json'
+}
+
+# GitHub API endpoints for workflow run reviews
+_PENDING_DEPLOYMENTS_URL_TMPL = 'https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/pending_deployments'
+_DPR_URL_TMPL = 'https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/deployment_protection_rule'
+
+# Seconds to wait on the GitHub API before giving up on a request
+GITHUB_API_TIMEOUT = 10.0
+
+# Shared HTTP session for GitHub API calls. Keeps connections to
+# api.github.com alive between requests so each call doesn't pay for a new
+# TCP + TLS handshake. Retries only cover connection failures and, for
+# idempotent requests, transient gateway errors.
+_gh_session = requests.Session()
+_gh_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+_gh_session.headers.update(_BASE_HEADERS)
+
+# Approvals run on a background pool so the webhook can be acknowledged
+# without waiting on the GitHub API. The semaphore bounds how many approvals
+# may be queued; past that, requests are handled inline as backpressure.
+APPROVAL_WORKERS = 16
+MAX_PENDING_APPROVALS = 64
+_executor = ThreadPoolExecutor(max_workers=APPROVAL_WORKERS, thread_name_prefix='approval')
+_pending_approvals = threading.BoundedSemaphore(MAX_PENDING_APPROVALS)
+
+# (epoch second, formatted UTC timestamp) for _utc_isoformat_now(); replaced
+# as a whole tuple so concurrent readers never see a mismatched pair
+_ts_cache = (0, '')
+
+# Deployments from these branches are auto-approved; everything else waits
+# for manual review
+_AUTO_APPROVE_REFS = frozenset({'main'})
+
+# Expected X-Hub-Signature-256 format: "sha256=" followed by a hex SHA-256 HMAC
+SIGNATURE_PREFIX = 'sha256='
+SIGNATURE_HEX_LENGTH = 64
+
+
+def _utc_isoformat_now() -> str:
+    """Return the current UTC time as ISO 8601, formatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    cached_at, formatted = _ts_cache
+    if now != cached_at:
+        formatted = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now))
+        _ts_cache = (now, formatted)
+    return formatted
+
+
+@lru_cache(maxsize=256)
+def _run_url(template: str, owner: str, repo: str, run_id: int) -> str:
+    """Build a workflow run endpoint URL, reusing it for repeated runs."""
+    return template.format_map({'owner': owner, 'repo': repo, 'run_id': run_id})
+
+
 def verify_webhook_signature(payload_body: bytes, signature_header: str) -> bool:
     """
     Verify that the webhook payload was sent by GitHub.
@@ -81,23 +202,30 @@ def verify_webhook_signature(payload_body: bytes, signature_header: str) -> bool
         logger.warning("No signature header provided")
         return False
     
-    # GitHub sends signature as "sha256=<signature>"
-    hash_algorithm, signature = signature_header.split('=')
+    # GitHub sends signature as "sha256=<64 hex digits>". Reject anything
+    # else with constant-size work before hashing the body.
+    if not signature_header.startswith(SIGNATURE_PREFIX):
+        logger.warning("Unsupported signature format")
+        return False
+    
+    signature_hex = signature_header[len(SIGNATURE_PREFIX):]
+    if len(signature_hex) != SIGNATURE_HEX_LENGTH:
+        logger.warning("Invalid webhook signature!")
+        return False
     
-    if hash_algorithm != 'sha256':
-        logger.warning(f"Unsupported hash algorithm: {hash_algorithm}")
+    try:
+        signature_bytes = bytes.fromhex(signature_hex)
+    except ValueError:
+        logger.warning("Invalid webhook signature!")
         return False
     
-    # Calculate expected signature
-    mac = hmac.new(
-        GITHUB_WEBHOOK_SECRET.encode(),
-        msg=payload_body,
-        digestmod=hashlib.sha256
-    )
-    expected_signature = mac.hexdigest()
+    cfg = CFG
+    
+    # Calculate expected signature (one-shot HMAC computed by OpenSSL)
+    expected_signature = hmac.digest(cfg.secret, payload_body, 'sha256')
     
-    # Compare signatures
-    is_valid = hmac.compare_digest(signature, expected_signature)
+    # Compare raw digests in constant time
+    is_valid = hmac.compare_digest(signature_bytes, expected_signature)
     
     if not is_valid:
         logger.warning("Invalid webhook signature!")
@@ -109,31 +237,43 @@ def generate_jwt() -> str:
     """
     Generate a JSON Web Token (JWT) for GitHub App authentication.
     
+    The token is cached and reused until shortly before it expires.
+    
     Returns:
         JWT token as string
     """
-    # Current time
-    now = int(time.time())
-    
-    # JWT payload
-    payload = {
-        # Issued at time (60 seconds in the past to allow for clock drift)
-        'iat': now - 60,
-        # JWT expiration time (10 minutes maximum)
-        'exp': now + (10 * 60),
-        # GitHub App's identifier
-        'iss': GITHUB_APP_ID
-    }
+    # Fast path: reuse the cached token while it is still valid
+    if _jwt_cache['token'] and time.time() < _jwt_cache['exp'] - JWT_REFRESH_MARGIN_SECONDS:
+        return _jwt_cache['token']
     
-    # Load private key
-    private_key = serialization.load_pem_private_key(
-        GITHUB_APP_PRIVATE_KEY.encode(),
-        password=None,
-        backend=default_backend()
-    )
+    cfg = CFG
     
-    # Create JWT
-    token = jwt.encode(payload, private_key, algorithm='RS256')
+    with _jwt_lock:
+        # Another thread may have refreshed the token while we waited
+        if _jwt_cache['token'] and time.time() < _jwt_cache['exp'] - JWT_REFRESH_MARGIN_SECONDS:
+            return _jwt_cache['token']
+        
+        # Current time
+        now = int(time.time())
+        exp = now + JWT_LIFETIME_SECONDS
+        
+        # JWT payload
+        payload = {
+            # Issued at time (60 seconds in the past to allow for clock drift)
+            'iat': now - 60,
+            # JWT expiration time (10 minutes maximum)
+            'exp': exp,
+            # GitHub App's identifier
+            'iss': cfg.app_id
+        }
+        
+        # Sign the JWT (RS256) directly with the key deserialized at startup
+        payload_b64 = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b'=')
+        signing_input = _JWT_HEADER_B64 + b'.' + payload_b64
+        signature = _RS256.sign(signing_input, cfg.private_key)
+        token = (signing_input + b'.' + base64.urlsafe_b64encode(signature).rstrip(b'=')).decode()
+        _jwt_cache['token'] = token
+        _jwt_cache['exp'] = exp
     
     logger.debug("Generated new JWT token")
     return token
@@ -143,30 +283,51 @@ def get_installation_access_token(installation_id: int) -> str:
     """
     Exchange JWT for an installation access token.
     
+    Tokens are cached per installation and reused until shortly before
+    they expire.
+    
     Args:
         installation_id: GitHub App installation ID
         
     Returns:
         Installation access token
     """
-    jwt_token = generate_jwt()
-    
-    url = f"https://api.github.com/app/installations/{installation_id}/access_tokens"
-    headers = {
-        'Accept': 'application/vnd.github+json',
-        'Authorization': f'Bearer {jwt_token}',
-        'X-GitHub-Api-Version': '2022-11-28'
-    }
-    
-    logger.info(f"Requesting installation access token for installation {installation_id}")
-    
-    response = requests.post(url, headers=headers)
-    response.raise_for_status()
-    
-    token_data = response.json()
-    logger.info("Successfully obtained installation access token")
+    # Fast path: reuse the cached token while it is still valid
+    cached = _inst_token_cache.get(installation_id)
+    if cached and cached[1] - time.time() > INSTALLATION_TOKEN_REFRESH_MARGIN_SECONDS:
+        logger.debug("Using cached installation access token for installation %s", installation_id)
+        return cached[0]
+    
+    with _inst_token_locks_guard:
+        inst_lock = _inst_token_locks.setdefault(installation_id, threading.Lock())
+    
+    with inst_lock:
+        # Another thread may have fetched the token while we waited
+        cached = _inst_token_cache.get(installation_id)
+        if cached and cached[1] - time.time() > INSTALLATION_TOKEN_REFRESH_MARGIN_SECONDS:
+            logger.debug("Using cached installation access token for installation %s", installation_id)
+            return cached[0]
+        
+        jwt_token = generate_jwt()
+        
+        url = f"https://api.github.com/app/installations/{installation_id}/access_tokens"
+        headers = {'Authorization': f'Bearer {jwt_token}'}
+        
+        logger.info("Requesting installation access token for installation %s", installation_id)
+        
+        response = _gh_session.post(url, headers=headers, timeout=GITHUB_API_TIMEOUT)
+        response.raise_for_status()
+        
+        token_data = response.json()
+        logger.info("Successfully obtained installation access token")
+        
+        token = token_data['token']
+        expires_at = datetime.fromisoformat(
+            token_data['expires_at'].replace('Z', '+00:00')
+        ).timestamp()
+        _inst_token_cache[installation_id] = (token, expires_at)
     
-    return token_data['token']
+    return token
 
 
 def approve_deployment(
@@ -196,38 +357,36 @@ def approve_deployment(
     
     # API endpoint
     #url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/deployment_protection_rule"
-    url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/pending_deployments"
+    url = _run_url(_PENDING_DEPLOYMENTS_URL_TMPL, owner, repo, run_id)
     
     # Request headers
-    headers = {
-        'Accept': 'application/vnd.github+json',
-        'Authorization': f'Bearer {access_token}',
-        'X-GitHub-Api-Version': '2022-11-28',
-        'Content-Type': 'application/json'
-    }
+    headers = {'Authorization': f'Bearer {access_token}'}
     
     # Request body
     data = {
         'environment_ids': environment_name,
         'state': 'approved',
-        'comment': comment or f'Auto-approved by custom protection rule at {datetime.utcnow().isoformat()}Z'
+        'comment': comment or 'Auto-approved by custom protection rule at ' + _utc_isoformat_now()
     }
     
-    logger.info(f"Approving deployment for run {run_id} in environment {environment_name}")
-    logger.debug(f"Approval data: {json.dumps(data, indent=2)}")
+    logger.info("Approving deployment for run %s in environment %s", run_id, environment_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Approval data: %s", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
     
     # Make API request
     #response = requests.post(url, headers=headers, json=data)
-    response = requests.post(url, headers=headers, json=data)
+    response = _gh_session.post(
+        url, headers=headers, data=orjson.dumps(data), timeout=GITHUB_API_TIMEOUT
+    )
     
-    logger.debug(f"Response data: {response}")
+    logger.debug("Response data: %s", response)
     
     if response.status_code == 204:
         logger.info("✅ Deployment approved successfully!")
         return {'status': 'approved', 'message': 'Deployment approved'}
     else:
-        logger.error(f"Failed to approve deployment: {response.status_code}")
-        logger.error(f"Response: {response.text}")
+        logger.error("Failed to approve deployment: %s", response.status_code)
+        logger.error("Response: %s", response.text)
         response.raise_for_status()
 
 
@@ -255,40 +414,69 @@ def reject_deployment(
     """
     access_token = get_installation_access_token(installation_id)
     
-    url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/deployment_protection_rule"
+    url = _run_url(_DPR_URL_TMPL, owner, repo, run_id)
     
-    headers = {
-        'Accept': 'application/vnd.github+json',
-        'Authorization': f'Bearer {access_token}',
-        'X-GitHub-Api-Version': '2022-11-28',
-        'Content-Type': 'application/json'
-    }
+    headers = {'Authorization': f'Bearer {access_token}'}
     
     data = {
         'environment_name': environment_name,
         'state': 'rejected',
-        'comment': comment or f'Rejected by custom protection rule at {datetime.utcnow().isoformat()}Z'
+        'comment': comment or 'Rejected by custom protection rule at ' + _utc_isoformat_now()
     }
     
-    logger.info(f"Rejecting deployment for run {run_id} in environment {environment_name}")
+    logger.info("Rejecting deployment for run %s in environment %s", run_id, environment_name)
     
-    response = requests.post(url, headers=headers, json=data)
+    response = _gh_session.post(
+        url, headers=headers, data=orjson.dumps(data), timeout=GITHUB_API_TIMEOUT
+    )
     
     if response.status_code == 204:
         logger.info("❌ Deployment rejected")
         return {'status': 'rejected', 'message': 'Deployment rejected'}
     else:
-        logger.error(f"Failed to reject deployment: {response.status_code}")
+        logger.error("Failed to reject deployment: %s", response.status_code)
         response.raise_for_status()
 
 
+def _on_approval_done(future: Future) -> None:
+    """Release the queue slot and log the outcome of a background approval."""
+    _pending_approvals.release()
+    error = future.exception()
+    if error is not None:
+        logger.error("Error approving deployment: %s", error, exc_info=error)
+    else:
+        logger.info("Successfully processed auto-approval")
+
+
+def submit_approval(**kwargs) -> bool:
+    """
+    Queue approve_deployment() to run in the background.
+    
+    Args:
+        **kwargs: Arguments passed through to approve_deployment()
+        
+    Returns:
+        True if the approval was queued, False if the queue is full
+    """
+    if not _pending_approvals.acquire(blocking=False):
+        return False
+    
+    try:
+        future = _executor.submit(approve_deployment, **kwargs)
+    except RuntimeError:
+        _pending_approvals.release()
+        raise
+    future.add_done_callback(_on_approval_done)
+    return True
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
     return jsonify({
         'status': 'healthy',
         'service': 'deployment-protection-webhook',
-        'timestamp': datetime.utcnow().isoformat() + 'Z'
+        'timestamp': _utc_isoformat_now()
     }), 200
 
 
@@ -306,97 +494,114 @@ def handle_webhook():
     event_type = request.headers.get('X-GitHub-Event')
     delivery_id = request.headers.get('X-GitHub-Delivery')
     
-    logger.info(f"Event Type: {event_type}")
-    logger.info(f"Delivery ID: {delivery_id}")
+    logger.info("Event Type: %s", event_type)
+    logger.info("Delivery ID: %s", delivery_id)
     
     # Verify webhook signature
     if not verify_webhook_signature(payload_body, signature):
         logger.error("Invalid webhook signature - rejecting request")
         return jsonify({'error': 'Invalid signature'}), 401
     
+    # Handle only deployment_protection_rule events (checked before parsing
+    # the body, so other events skip JSON decoding)
+    if event_type != 'deployment_protection_rule':
+        logger.info("Ignoring event type: %s", event_type)
+        return jsonify({'message': 'Event type not supported'}), 200
+    
     # Parse payload
     try:
-        payload = json.loads(payload_body)
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON payload: {e}")
+        payload = orjson.loads(payload_body)
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse JSON payload: %s", e)
         return jsonify({'error': 'Invalid JSON'}), 400
     
     # Log payload for debugging
-    logger.debug(f"Payload: {json.dumps(payload, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Payload: %s", orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
     
-    # Handle only deployment_protection_rule events
-    if event_type != 'deployment_protection_rule':
-        logger.info(f"Ignoring event type: {event_type}")
-        return jsonify({'message': 'Event type not supported'}), 200
+    # Only 'requested' actions need a decision; skip field extraction otherwise
+    action = payload.get('action') if isinstance(payload, dict) else None
+    if action != 'requested':
+        logger.info("Action '%s' does not require processing", action)
+        return jsonify({'message': 'Action not handled'}), 200
     
     # Extract important information
-    action = payload.get('action')
     environment = payload.get('environment')
     event = payload.get('event')  # This tells us what triggered the workflow
-    deployment = payload.get('deployment', {})
-    repository = payload.get('repository', {})
-    installation = payload.get('installation', {})
-    
-    owner = repository.get('owner', {}).get('login')
-    repo = repository.get('name')
-    installation_id = installation.get('id')
-    
-    # Extract workflow run ID from deployment
-    workflow_run_id = deployment.get('id')
-    ref = deployment.get('ref')  # This tells us what branch was workflow triggerd on
-    
-    logger.info(f"Action: {action}")
-    logger.info(f"Environment: {environment}")
-    logger.info(f"Trigger Event: {event}")
-    logger.info(f"Trigger Branch: {ref}")
-    logger.info(f"Repository: {owner}/{repo}")
-    logger.info(f"Workflow Run ID: {workflow_run_id}")
-    logger.info(f"Installation ID: {installation_id}")
+    
+    # Fields needed to call the GitHub API are required
+    try:
+        deployment = payload['deployment']
+        repository = payload['repository']
+        
+        owner = repository['owner']['login']
+        repo = repository['name']
+        installation_id = payload['installation']['id']
+        
+        # Extract workflow run ID from deployment
+        workflow_run_id = deployment['id']
+        ref = deployment.get('ref')  # This tells us what branch was workflow triggerd on
+    except KeyError as e:
+        logger.error("Payload is missing a required field: %s", e)
+        return jsonify({'error': 'Missing field', 'field': e.args[0]}), 400
+    except TypeError as e:
+        logger.error("Payload has a malformed field: %s", e)
+        return jsonify({'error': 'Malformed field'}), 400
+    
+    logger.info("Action: %s", action)
+    logger.info("Environment: %s", environment)
+    logger.info("Trigger Event: %s", event)
+    logger.info("Trigger Branch: %s", ref)
+    logger.info("Repository: %s/%s", owner, repo)
+    logger.info("Workflow Run ID: %s", workflow_run_id)
+    logger.info("Installation ID: %s", installation_id)
     
     # Decision logic: Auto-approve scheduled events
-    if action == 'requested':
-        #if event == 'schedule':
-        if ref == 'main':
-            # Auto-approve scheduled deployments
-            #logger.info("⏰ Scheduled deployment detected - AUTO-APPROVING")
-            logger.info("⏰ Main branch deployment detected - AUTO-APPROVING")
-            
-            try:
-                result = approve_deployment(
-                    owner=owner,
-                    repo=repo,
-                    run_id=workflow_run_id,
-                    installation_id=installation_id,
-                    environment_name=environment,
-                    comment='✅ Auto-approved: Scheduled deployment'
-                )
-                
-                logger.info("Successfully processed auto-approval")
-                return jsonify(result), 200
-                
-            except Exception as e:
-                logger.error(f"Error approving deployment: {e}", exc_info=True)
-                return jsonify({'error': str(e)}), 500
+    #if event == 'schedule':
+    if ref in _AUTO_APPROVE_REFS:
+        # Auto-approve scheduled deployments
+        #logger.info("⏰ Scheduled deployment detected - AUTO-APPROVING")
+        logger.info("⏰ Main branch deployment detected - AUTO-APPROVING")
+        
+        approval = dict(
+            owner=owner,
+            repo=repo,
+            run_id=workflow_run_id,
+            installation_id=installation_id,
+            environment_name=environment,
+            comment='✅ Auto-approved: Scheduled deployment'
+        )
         
-        else:
-            # For other events, we'll just log and let manual review happen
-            logger.info(f"👆 Manual trigger detected (event: {event}) - REQUIRES MANUAL REVIEW")
-            logger.info("The deployment will wait for a human reviewer to approve it")
+        # Acknowledge right away and approve in the background
+        if submit_approval(**approval):
+            return jsonify({'message': 'Deployment approval accepted'}), 202
+        
+        logger.warning("Approval queue is full - approving inline")
+        try:
+            result = approve_deployment(**approval)
             
-            # Optionally, you could add custom logic here:
-            # - Check if certain conditions are met
-            # - Query external systems
-            # - Apply business rules
-            # - etc.
+            logger.info("Successfully processed auto-approval")
+            return jsonify(result), 200
             
-            return jsonify({
-                'message': 'Deployment requires manual review',
-                'trigger': event
-            }), 200
+        except Exception as e:
+            logger.error("Error approving deployment: %s", e, exc_info=True)
+            return jsonify({'error': str(e)}), 500
     
     else:
-        logger.info(f"Action '{action}' does not require processing")
-        return jsonify({'message': 'Action not handled'}), 200
+        # For other events, we'll just log and let manual review happen
+        logger.info("👆 Manual trigger detected (event: %s) - REQUIRES MANUAL REVIEW", event)
+        logger.info("The deployment will wait for a human reviewer to approve it")
+        
+        # Optionally, you could add custom logic here:
+        # - Check if certain conditions are met
+        # - Query external systems
+        # - Apply business rules
+        # - etc.
+        
+        return jsonify({
+            'message': 'Deployment requires manual review',
+            'trigger': event
+        }), 200
 
 
 @app.errorhandler(404)
@@ -408,20 +613,48 @@ def not_found(error):
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    logger.error(f"Internal server error: {error}", exc_info=True)
+    logger.error("Internal server error: %s", error, exc_info=True)
     return jsonify({'error': 'Internal server error'}), 500
 
 
+def _warm_up_github_connection() -> None:
+    """Open a pooled connection to api.github.com ahead of the first webhook."""
+    try:
+        response = _gh_session.get('https://api.github.com/zen', timeout=5)
+        logger.info("GitHub API connection warmed up (status %s)", response.status_code)
+    except requests.exceptions.RequestException as e:
+        logger.info("GitHub API connection warm-up failed: %s", e)
+
+
+def start_github_warm_up() -> None:
+    """
+    Establish DNS/TCP/TLS to GitHub in a background thread, so the first
+    webhook finds a keep-alive connection in the pool.
+    
+    Called once per serving process: from gunicorn's post_worker_init hook
+    (see gunicorn.conf.py) or when running the development server.
+    """
+    threading.Thread(target=_warm_up_github_connection, name='github-warm-up', daemon=True).start()
+
+
+# In production the app is served by gunicorn (see gunicorn.conf.py); running
+# this module directly starts Flask's development server for local testing.
 if __name__ == '__main__':
     logger.info("=" * 80)
     logger.info("Starting GitHub Deployment Protection Webhook Server")
-    logger.info(f"GitHub App ID: {GITHUB_APP_ID}")
-    logger.info(f"Port: {PORT}")
+    logger.info("GitHub App ID: %s", GITHUB_APP_ID)
+    logger.info("Port: %s", PORT)
     logger.info("=" * 80)
     
+    debug = os.environ.get('FLASK_ENV') != 'production'
+    
+    # With the debug reloader, only the child process serves requests
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_github_warm_up()
+    
     # Run Flask app
     app.run(
         host='0.0.0.0',
         port=PORT,
-        debug=os.environ.get('FLASK_ENV') != 'production'
+        debug=debug
     )
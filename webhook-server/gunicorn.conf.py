@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the webhook server.
+
+Webhook handling is almost entirely spent waiting on the GitHub API, so each
+worker runs several threads (gthread) to let concurrent deliveries proceed
+instead of queueing behind one another. The JWT and installation token
+caches in app.py are per process and shared between a worker's threads,
+which is why they are guarded by threading.Lock.
+
+Each worker also has its own approval thread pool, token caches and GitHub
+connection warm-up, so the worker count defaults to a small fixed number
+rather than one derived from the host's CPUs (which ignores container CPU
+quotas). Set GUNICORN_WORKERS to scale it.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = 30
+accesslog = '-'
+errorlog = '-'
+
+
+def post_worker_init(worker):
+    """Warm up the GitHub API connection once the worker has loaded the app."""
+    from app import start_github_warm_up
+    start_github_warm_up()